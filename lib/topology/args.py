@@ -146,14 +146,14 @@ def parse_options(raw):
 
     for option in raw:
 
-        if '=' not in option:
+        key, separator, value = option.partition('=')
+
+        if not separator:
             raise InvalidArgument(
                 'Invalid option "{}", options must follow '
                 'the syntax "<option_name>=<value>"'.format(option)
             )
 
-        key, value = option.split('=', 1)
-
         # Check key form
         if not REGEX_SLUG.match(key):
             raise InvalidArgument(
@@ -193,7 +193,7 @@ def validate_args(args):
     level = V_LEVELS.get(args.verbose, logging.DEBUG)
     logging.basicConfig(format=FORMAT, level=level)
 
-    log.debug('Raw arguments:\n{}'.format(args))
+    log.debug('Raw arguments:\n%s', args)
 
     # Verify topology file exists
     if not isfile(args.topology):
@@ -219,7 +219,8 @@ def validate_args(args):
     # Parse options
     if args.options:
         args.options = parse_options(args.options)
-        log.debug('Options given:\n{}'.format(pformat(args.options)))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('Options given:\n%s', pformat(args.options))
 
     return args
 
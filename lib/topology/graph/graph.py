@@ -18,7 +18,7 @@
 
 from copy import deepcopy
 from warnings import warn
-from typing import Iterator, Tuple
+from typing import Iterable, Iterator, Tuple
 
 from pprintpp import pformat
 
@@ -147,6 +147,77 @@ class TopologyGraph:
 
         return link
 
+    def bulk_load(
+        self,
+        nodes: Iterable[Tuple[str, dict]] = (),
+        ports: Iterable[Tuple[str, str, dict]] = (),
+        links: Iterable[Tuple[str, str, str, str, dict]] = ()
+    ):
+        """
+        Creates several nodes, ports and links in a single call.
+
+        This is equivalent to calling :meth:`create_node` for every node,
+        then :meth:`create_port` for every port and then :meth:`create_link`
+        for every link, but without the overhead of going through those
+        methods one element at a time. As with them, elements that already
+        exist are left untouched, and nodes or ports referenced by a port or
+        link that do not exist yet are created without metadata.
+
+        The metadata dictionaries are owned by the graph after this call.
+
+        :param nodes: Iterable of ``(node_id, metadata)`` tuples.
+        :param ports: Iterable of ``(node_id, port_label, metadata)`` tuples.
+        :param links: Iterable of
+         ``(node1_id, port1_label, node2_id, port2_label, metadata)`` tuples.
+        """
+        graph_nodes = self._nodes
+        graph_ports = self._ports
+        graph_links = self._links
+
+        def ensure_node(node_id, metadata=None):
+            node = graph_nodes.get(node_id)
+            if node is None:
+                node = Node(node_id, metadata=metadata)
+                graph_nodes[node_id] = node
+            return node
+
+        def ensure_port(node_id, label, metadata=None):
+            # Nodes are almost always declared before their ports, so only
+            # fall back to creating the node when the lookup misses
+            node = graph_nodes.get(node_id)
+            if node is None:
+                node = ensure_node(node_id)
+
+            port_id = Port.calc_id(node_id, label)
+            port = graph_ports.get(port_id)
+            if port is None:
+                port = Port(label, node_id, metadata=metadata)
+                node.add_port(port)
+                graph_ports[port_id] = port
+            return port
+
+        for node_id, metadata in nodes:
+            ensure_node(node_id, metadata)
+
+        for node_id, label, metadata in ports:
+            ensure_port(node_id, label, metadata)
+
+        for node1_id, port1_label, node2_id, port2_label, metadata in links:
+            link_id = Link.calc_id(
+                node1_id, port1_label, node2_id, port2_label)
+            if link_id in graph_links:
+                continue
+
+            port1 = ensure_port(node1_id, port1_label)
+            port2 = ensure_port(node2_id, port2_label)
+
+            link = Link(
+                graph_nodes[node1_id], port1,
+                graph_nodes[node2_id], port2,
+                metadata=metadata
+            )
+            graph_links[link.identifier] = link
+
     def get_node(self, node_id: str) -> Node:
         """
         Returns the node with the given id.
@@ -296,7 +367,7 @@ class TopologyGraph:
             DeprecationWarning
         )
         for link in self._links.values():
-            yield ((link.node1, link.port1), (link.node2, link.port2), link)
+            yield link.endpoints + (link,)
 
     def biports(self) -> Iterator[Tuple[Node, Port]]:
         """
@@ -20,6 +20,7 @@ Topology Graph Link module.
 """
 
 from copy import deepcopy
+from typing import Tuple
 
 from pprintpp import pformat
 
@@ -51,6 +52,7 @@ class Link:
         self._port1 = port1
         self._port2 = port2
         self._metadata = {} if metadata is None else metadata
+        self._endpoints = ((node1, port1), (node2, port2))
 
         # Allow to override the identifier of the link.
         self.identifier = self.metadata.pop(
@@ -132,6 +134,14 @@ class Link:
         """
         return self._port2
 
+    @property
+    def endpoints(self) -> Tuple[Tuple[Node, Port], Tuple[Node, Port]]:
+        """
+        Returns the endpoints of the link as a 2-tuple of the form:
+        ((node1, port1), (node2, port2)).
+        """
+        return self._endpoints
+
     @property
     def metadata(self) -> dict:
         """
@@ -32,7 +32,7 @@ from traceback import format_exc
 from collections import OrderedDict
 from argparse import Namespace
 
-from pkg_resources import iter_entry_points
+from ..entrypoints import entry_points
 
 
 log = logging.getLogger(__name__)
@@ -70,7 +70,7 @@ def libraries(cache=True):
     available = {}
 
     # Iterate over entry points
-    for ep in iter_entry_points(group='topology_library_10'):
+    for ep in entry_points(group='topology_library_10'):
 
         name = ep.name
 
@@ -81,7 +81,8 @@ def libraries(cache=True):
                 'Unable to load topology communication '
                 'library plugin {}.'.format(name)
             )
-            log.debug(format_exc())
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(format_exc())
             continue
 
         # Validate library
@@ -130,27 +131,34 @@ class LibsProxy(object):
     def __init__(self, enode):
         super(LibsProxy, self).__init__()
         self._enode = enode
-        self._libraries = OrderedDict()
 
-        for libname, callables in libraries().items():
-            # We create a dictionary using dictionary comprehension syntax
-            # that will map for each callable in the library the name of
-            # such callable with a new partial function that will bind the
-            # first argument to the enode. Then, we expand that dictionary and
-            # feed it as kwargs to the Namespace class, that will allow us
-            # to use the dictionary keys as instance attributes.
-            # Very nice Python magic indeed.
-            self._libraries[libname] = Namespace(**{
-                c.__name__: partial(c, enode) for c in callables
-            })
+        # Bound libraries are created on first access, as most engine nodes
+        # only use a few of the available libraries, if any
+        self._libraries = OrderedDict()
 
     def __getattr__(self, name):
-        if name not in self._libraries:
+        if name in self._libraries:
+            return self._libraries[name]
+
+        callables = libraries().get(name, None)
+        if callables is None:
             raise Exception(
                 'Unknown communication library function {}. '
                 'Are you missing a dependency?'.format(name)
             )
-        return self._libraries[name]
+
+        # We create a dictionary using dictionary comprehension syntax
+        # that will map for each callable in the library the name of
+        # such callable with a new partial function that will bind the
+        # first argument to the enode. Then, we expand that dictionary and
+        # feed it as kwargs to the Namespace class, that will allow us
+        # to use the dictionary keys as instance attributes.
+        # Very nice Python magic indeed.
+        library = Namespace(**{
+            c.__name__: partial(c, self._enode) for c in callables
+        })
+        self._libraries[name] = library
+        return library
 
 
 __all__ = ['LibsProxy', 'libraries']
@@ -23,18 +23,14 @@ suite, commanding its construction to appropriate topology platform plugin
 and finally commanding its destruction to the plugin also.
 """
 
-from __future__ import unicode_literals, absolute_import
-from __future__ import print_function, division
-
 import logging
-from sys import exc_info
 from warnings import warn
 from copy import deepcopy
-from datetime import datetime
+from time import strftime
+from functools import lru_cache
 from traceback import format_exc
 from collections import OrderedDict
 
-from six import string_types
 from pyszn.parser import parse_txtmeta
 
 from .graph import TopologyGraph, Link
@@ -45,6 +41,18 @@ from .platforms.manager import platforms, load_platform, DEFAULT_PLATFORM
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _parse_txtmeta(txtmeta):
+    """
+    Memoized :func:`pyszn.parser.parse_txtmeta`.
+
+    The same textual description is usually parsed many times (for example,
+    once per test module using it). Callers must not modify the returned
+    dictionary, as it is shared between calls.
+    """
+    return parse_txtmeta(txtmeta)
+
+
 class TopologyManager(object):
     """
     Main Topology Manager object.
@@ -83,7 +91,7 @@ class TopologyManager(object):
         super(TopologyManager, self).__init__()
 
         if engine not in platforms():
-            raise RuntimeError('Unknown platform engine "{}".'.format(engine))
+            raise RuntimeError(f'Unknown platform engine "{engine}".')
 
         self.graph = TopologyGraph()
         self.engine = engine
@@ -152,94 +160,90 @@ class TopologyManager(object):
         :param dict inject: An attributes injection sub-dictionary as defined
          by :func:`parse_attribute_injection`.
         """
+        # Run-specific attributes to inject. These are usually sparse, so a
+        # single lookup per element is done below.
+        if inject is None:
+            inject = {}
+        inject_nodes = inject.get('nodes', {})
+        inject_ports = inject.get('ports', {})
+        inject_links = inject.get('links', {})
+
         # Load the environment
         environment = dictmeta.get('environment', OrderedDict())
-        if inject is not None and 'environment' in inject:
+        if 'environment' in inject:
             environment.update(inject['environment'])
 
         self.graph.environment = environment
 
         # Load nodes
+        nodes = []
         node_to_parent = {}
         for nodes_spec in dictmeta.get('nodes', []):
+            parent_id = nodes_spec['parent']
+
             for node_id in nodes_spec['nodes']:
 
                 # Get node attributes
                 attrs = deepcopy(nodes_spec['attributes'])
 
                 # Inject the run-specific attributes
-                if inject is not None and node_id in inject['nodes']:
-                    attrs.update(inject['nodes'][node_id])
+                injected = inject_nodes.get(node_id)
+                if injected is not None:
+                    attrs.update(injected)
 
-                # Create a new node
-                self.graph.create_node(node_id, **attrs)
+                nodes.append((node_id, attrs))
 
-                parent_id = nodes_spec['parent']
                 if parent_id is not None:
                     node_to_parent[node_id] = parent_id
 
         # Load ports
+        ports = []
         for ports_spec in dictmeta.get('ports', []):
             for node_id, port_label in ports_spec['ports']:
 
-                # Create the node if still not created
-                self.graph.create_node(node_id)
-
                 # Get port attributes
                 attrs = deepcopy(ports_spec['attributes'])
 
                 # Inject the run-specific attributes
-                if (
-                    inject is not None and
-                    (node_id, port_label) in inject['ports']
-                ):
-                    attrs.update(inject['ports'][(node_id, port_label)])
+                injected = inject_ports.get((node_id, port_label))
+                if injected is not None:
+                    attrs.update(injected)
 
-                # Create a new port. This call also adds the port to the
-                # topology and node.
-                self.graph.create_port(port_label, node_id, **attrs)
+                ports.append((node_id, port_label, attrs))
 
         # Load links
+        links = []
         for link_spec in dictmeta.get('links', []):
 
             # Get link attributes
             attrs = deepcopy(link_spec['attributes'])
 
             # Inject the run-specific attributes
-            if (
-                inject is not None and
-                link_spec['endpoints'] in inject['links']
-            ):
-                attrs.update(inject['links'][link_spec['endpoints']])
+            injected = inject_links.get(link_spec['endpoints'])
+            if injected is not None:
+                attrs.update(injected)
 
-            # This variable will hold these data for the link:
-            # endpoints = [(node1_id, port1_label), (node2_id, port2_label)]
-            endpoints = []
+            # Decompose the endpoints into two (node_id, port_label) tuples
+            (node1_id, port1_label), (node2_id, port2_label) = \
+                link_spec['endpoints']
 
-            for node_id, port_label in link_spec['endpoints']:
-
-                # Create the node if it's still not created
-                self.graph.create_node(node_id)
-
-                # Create the port if it's still not created.
-                self.graph.create_port(port_label, node_id)
-
-                # Register endpoint
-                endpoints.append((node_id, port_label))
-
-            # Decompose the endpoints list into two tuples
-            node1_id, port1_label = endpoints[0]
-            node2_id, port2_label = endpoints[1]
-
-            # Create a new link
-            self.graph.create_link(
-                node1_id, port1_label, node2_id, port2_label, **attrs
+            links.append(
+                (node1_id, port1_label, node2_id, port2_label, attrs)
             )
 
-        # Set parent-child relationships
+        # Create all nodes, ports and links at once. Nodes and ports
+        # referenced by ports or links but not declared are created too.
+        self.graph.bulk_load(nodes, ports, links)
+
+        # Set parent-child relationships. Many children usually share the
+        # same parent, so look up each parent only once.
+        parents = {}
         for node_id, parent_id in node_to_parent.items():
             node = self.graph.get_node(node_id)
-            parent = self.graph.get_node(parent_id)
+
+            parent = parents.get(parent_id)
+            if parent is None:
+                parent = parents[parent_id] = self.graph.get_node(parent_id)
 
             # Set the child's parent
             node.parent = parent
@@ -260,7 +264,8 @@ class TopologyManager(object):
         :param dict inject: An attributes injection sub-dictionary as defined
          by :func:`parse_attribute_injection`.
         """
-        data = parse_txtmeta(txtmeta)
+        # Copy the cached result, as loading it may modify it
+        data = deepcopy(_parse_txtmeta(txtmeta))
         if load:
             self.load(data, inject=inject)
         return data
@@ -288,7 +293,7 @@ class TopologyManager(object):
             )
         # Instance platform
         plugin = load_platform(self.engine)
-        timestamp = datetime.now().replace(microsecond=0).isoformat()
+        timestamp = strftime('%Y-%m-%dT%H:%M:%S')
 
         self._platform = plugin(
             timestamp, self.graph, **self.options
@@ -341,31 +346,35 @@ class TopologyManager(object):
                 node_enode_map[node.identifier] = enode.identifier
                 self.nodes[enode.identifier] = enode
                 # Register empty port map
-                self.ports[enode.identifier] = OrderedDict()
+                self.ports[enode.identifier] = {}
 
             stage = 'add_biport'
             for node in self.graph.nodes():
+                eports = {}
+
                 for port in node.ports():
                     eport = self._platform.add_biport(node, port)
 
                     # Check that engine port is of correct type
-                    if not isinstance(eport, string_types):
+                    if not isinstance(eport, str):
                         msg = (
                             'Platform {} returned an invalid '
                             'engine port name {}.'
-                        ).format(self.engine, enode)
+                        ).format(self.engine, eport)
                         log.critical(msg)
                         raise Exception(msg)
 
-                    # Register engine port
-                    label = port.metadata.get('label', port.identifier)
-                    enode_id = node_enode_map[node.identifier]
-                    self.ports[enode_id][label] = eport
+                    # The port label is always kept in its metadata, so
+                    # avoid copying the whole metadata just to get it
+                    eports[port.label] = eport
+
+                # Register engine ports
+                enode_id = node_enode_map[node.identifier]
+                self.ports[enode_id] = eports
 
             stage = 'add_bilink'
             for link in self.graph.links():
-                node_porta = (link.node1, link.port1)
-                node_portb = (link.node2, link.port2)
+                node_porta, node_portb = link.endpoints
                 self._platform.add_bilink(node_porta, node_portb, link)
 
             stage = 'post_build'
@@ -378,15 +387,15 @@ class TopologyManager(object):
 
             self._platform.post_build()
 
-        except (Exception, KeyboardInterrupt):
-            e = exc_info()[1]
+        except (Exception, KeyboardInterrupt) as e:
             log.critical(
                 (
                     'Build failed at stage "{}" with "{}". '
                     'Calling plugin rollback routine...'
                 ).format(stage, e)
             )
-            log.debug(format_exc())
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(format_exc())
             self._platform.rollback(stage, self.nodes, e)
             raise
 
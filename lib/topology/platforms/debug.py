@@ -61,27 +61,24 @@ class DebugPlatform(BasePlatform):
         """
         See :meth:`BasePlatform.add_node` for more information.
         """
-        log.debug('[HOOK] add_node({})'.format(
-            node
-        ))
+        log.debug('[HOOK] add_node(%s)', node)
         return DebugNode(node.identifier, **node.metadata)
 
     def add_biport(self, node, biport):
         """
         See :meth:`BasePlatform.add_biport` for more information.
         """
-        log.debug('[HOOK] add_biport({}, {})'.format(
-            node, biport
-        ))
+        log.debug('[HOOK] add_biport(%s, %s)', node, biport)
         return biport.metadata.get('label', biport.identifier)
 
     def add_bilink(self, nodeport_a, nodeport_b, bilink):
         """
         See :meth:`BasePlatform.add_bilink` for more information.
         """
-        log.debug('[HOOK] add_bilink({}, {}, {})'.format(
+        log.debug(
+            '[HOOK] add_bilink(%s, %s, %s)',
             nodeport_a, nodeport_b, bilink
-        ))
+        )
 
     def post_build(self):
         """
@@ -99,25 +96,19 @@ class DebugPlatform(BasePlatform):
         """
         See :meth:`BasePlatform.rollback` for more information.
         """
-        log.debug('[HOOK] rollback({}, {}, {})'.format(
-            stage, enodes, exception
-        ))
+        log.debug('[HOOK] rollback(%s, %s, %s)', stage, enodes, exception)
 
     def relink(self, link_id):
         """
         See :meth:`BasePlatform.relink` for more information.
         """
-        log.debug('[CALL] relink({})'.format(
-            link_id
-        ))
+        log.debug('[CALL] relink(%s)', link_id)
 
     def unlink(self, link_id):
         """
         See :meth:`BasePlatform.unlink` for more information.
         """
-        log.debug('[CALL] unlink({})'.format(
-            link_id
-        ))
+        log.debug('[CALL] unlink(%s)', link_id)
 
 
 class DebugNode(CommonNode):
@@ -136,9 +127,13 @@ class DebugNode(CommonNode):
 
         See :meth:`CommonNode.send_command` for more information.
         """
-        log.debug('{} [{}].send_command(\'{}\', shell=\'{}\') ::'.format(
-            datetime.now().isoformat(), str(self), cmd, shell
-        ))
+        # Skip building the timestamp and node representation on every
+        # command unless they are going to be logged
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                '%s [%s].send_command(\'%s\', shell=\'%s\') ::',
+                datetime.now().isoformat(), self, cmd, shell
+            )
         return cmd
 
     def _get_services_address(self):
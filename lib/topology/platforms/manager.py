@@ -28,9 +28,8 @@ from __future__ import print_function, division
 import logging
 from inspect import isclass
 
-from pkg_resources import iter_entry_points
-
 from .platform import BasePlatform
+from ..entrypoints import entry_points
 
 
 log = logging.getLogger(__name__)
@@ -42,6 +41,40 @@ Default platform engine.
 """
 
 
+_AVAILABLE = None
+"""
+Cached sorted tuple of the available platform engines.
+"""
+
+_ENTRY_POINTS = None
+"""
+Cached index of the platform engines entry points, by name.
+"""
+
+
+def _entry_points(cache=True):
+    """
+    Index the entry points registered for the platform engines.
+
+    :param bool cache: If ``True`` return the cached index. If ``False`` force
+     lookup for plugins registered for the entry point.
+    :rtype: dict
+    :return: A dictionary associating the name of each platform engine with
+     the list of entry points registered under that name.
+    """
+    global _ENTRY_POINTS
+
+    if cache and _ENTRY_POINTS is not None:
+        return _ENTRY_POINTS
+
+    index = {}
+    for ep in entry_points(group='topology_platform_10'):
+        index.setdefault(ep.name, []).append(ep)
+
+    _ENTRY_POINTS = index
+    return index
+
+
 def platforms(cache=True):
     """
     List all available platform engines.
@@ -51,25 +84,18 @@ def platforms(cache=True):
 
     :param bool cache: If ``True`` return the cached result. If ``False`` force
      lookup for plugins registered for the entry point.
-    :rtype: list
-    :return: A sorted list with all available platforms.
+    :rtype: tuple
+    :return: A sorted tuple with all available platforms.
     """
+    global _AVAILABLE
 
     # Return cached value if call is repeated
-    if cache and hasattr(platforms, 'available'):
-        return list(platforms.available)
-
-    # Add default plugin
-    available = []
-
-    # Iterate over entry points
-    for ep in iter_entry_points(group='topology_platform_10'):
-        available.append(ep.name)
-
-    available.sort()
-    platforms.available = available
+    if cache and _AVAILABLE is not None:
+        return _AVAILABLE
 
-    return list(available)
+    # Share the entry points scan with load_platform()
+    _AVAILABLE = tuple(sorted(_entry_points(cache=cache)))
+    return _AVAILABLE
 
 
 def load_platform(name):
@@ -81,11 +107,11 @@ def load_platform(name):
     :rtype: A :class:`BasePlatform` subclass
     :return: The implementation class on the platform engine.
     """
-    if name not in platforms():
-        raise RuntimeError('Unknown platform engine "{}".'.format(name))
+    registered = _entry_points().get(name, None)
+    if registered is None:
+        raise RuntimeError(f'Unknown platform engine "{name}".')
 
-    # Iterate over entry points
-    for ep in iter_entry_points(group='topology_platform_10', name=name):
+    for ep in registered:
 
         try:
             platform = ep.load()
@@ -106,7 +132,7 @@ def load_platform(name):
         return platform
 
     raise RuntimeError(
-        'Platform engine "{}"" not in entry points.'.format(name)
+        f'Platform engine "{name}"" not in entry points.'
     )
 
 
@@ -25,12 +25,9 @@ from __future__ import unicode_literals, absolute_import
 from __future__ import print_function, division
 
 import logging
-from datetime import datetime
-from collections import OrderedDict
+from sys import intern
 from abc import ABCMeta, abstractmethod
 
-from six import add_metaclass, iterkeys
-
 from .service import BaseService
 from ..libraries.manager import LibsProxy
 from .shell import ShellContext, BaseShell
@@ -39,8 +36,24 @@ from .shell import ShellContext, BaseShell
 log = logging.getLogger(__name__)
 
 
-@add_metaclass(ABCMeta)
-class HighLevelShellAPI(object):
+class UnknownShellError(KeyError):
+    """
+    Exception raised by engine nodes when a command is sent to a shell the
+    node doesn't have.
+
+    The error message is only formatted if the exception is displayed.
+
+    :param str shell: Name of the requested shell.
+    """
+    def __init__(self, shell):
+        super(UnknownShellError, self).__init__(shell)
+        self.shell = shell
+
+    def __str__(self):
+        return 'Shell {} is not supported.'.format(self.shell)
+
+
+class HighLevelShellAPI(object, metaclass=ABCMeta):
     """
     API used to interact with node shells.
 
@@ -81,6 +94,27 @@ class HighLevelShellAPI(object):
         :rtype: str
         """
 
+    def send_commands(self, cmds, shell=None, silent=False):
+        """
+        Send several commands to this engine node, in order.
+
+        Engine nodes may override this method to avoid repeating, for every
+        command, work that :meth:`send_command` does per call.
+
+        :param cmds: Commands to send.
+        :type cmds: Iterable of str.
+        :param str shell: Shell that must interpret the commands.
+         ``None`` for the default shell. See :meth:`send_command`.
+        :param bool silent: True to call the shell logger, False
+         otherwise.
+
+        :return: The responses of the commands, in the same order.
+        :rtype: List of str.
+        """
+        return [
+            self.send_command(cmd, shell=shell, silent=silent) for cmd in cmds
+        ]
+
     def __call__(self, *args, **kwargs):
         return self.send_command(*args, **kwargs)
 
@@ -95,8 +129,7 @@ class HighLevelShellAPI(object):
         """
 
 
-@add_metaclass(ABCMeta)
-class LowLevelShellAPI(object):
+class LowLevelShellAPI(object, metaclass=ABCMeta):
     """
     API used to interact with low level shell objects.
     """
@@ -138,8 +171,7 @@ class LowLevelShellAPI(object):
         """
 
 
-@add_metaclass(ABCMeta)
-class ServicesAPI(object):
+class ServicesAPI(object, metaclass=ABCMeta):
     """
     API to gather information and connection parameters to a node services.
     """
@@ -192,8 +224,7 @@ class ServicesAPI(object):
         """
 
 
-@add_metaclass(ABCMeta)
-class StateAPI(object):
+class StateAPI(object, metaclass=ABCMeta):
     """
     API to control the enable/disabled state of a node.
     """
@@ -224,8 +255,10 @@ class StateAPI(object):
         """
 
 
-@add_metaclass(ABCMeta)
-class BaseNode(HighLevelShellAPI, LowLevelShellAPI, ServicesAPI, StateAPI):
+class BaseNode(
+    HighLevelShellAPI, LowLevelShellAPI, ServicesAPI, StateAPI,
+    metaclass=ABCMeta
+):
     """
     Base engine node class.
 
@@ -244,16 +277,16 @@ class BaseNode(HighLevelShellAPI, LowLevelShellAPI, ServicesAPI, StateAPI):
      is populated by the :class:`topology.manager.TopologyManager`.
     """
 
-    @abstractmethod
     def __init__(self, identifier, **kwargs):
         super(BaseNode, self).__init__()
+        if isinstance(identifier, str):
+            identifier = intern(identifier)
         self.identifier = identifier
         self.metadata = kwargs
-        self.ports = OrderedDict()
+        self.ports = {}
 
 
-@add_metaclass(ABCMeta)
-class CommonNode(BaseNode):
+class CommonNode(BaseNode, metaclass=ABCMeta):
     """
     Base engine node class with a common base implementation.
 
@@ -276,16 +309,15 @@ class CommonNode(BaseNode):
        Platform Engine base node.
     """
 
-    @abstractmethod
     def __init__(self, identifier, **kwargs):
         super(CommonNode, self).__init__(identifier, **kwargs)
 
         # Shell(s) API
         self._default_shell = None
-        self._shells = OrderedDict()
+        self._shells = {}
 
         # Services API
-        self._services = OrderedDict()
+        self._services = {}
 
         # State API
         self._enabled = True
@@ -311,12 +343,12 @@ class CommonNode(BaseNode):
         """
         Implementation of the public ``available_shells`` interface.
 
-        This method will just list the available keys in the internal ordered
-        dictionary.
+        This method will just list the available keys in the internal
+        dictionary, in registration order.
 
         See :meth:`HighLevelShellAPI.available_shells` for more information.
         """
-        return list(iterkeys(self._shells))
+        return list(self._shells)
 
     def send_command(self, cmd, shell=None, silent=False):
         """
@@ -329,31 +361,66 @@ class CommonNode(BaseNode):
         See :meth:`HighLevelShellAPI.send_command` for more information.
         """
 
+        active_shell = self._resolve_shell(shell)
+
+        active_shell.send_command(cmd, silent=silent)
+
+        response = active_shell.get_response(silent=silent)
+
+        return response
+
+    def send_commands(self, cmds, shell=None, silent=False):
+        """
+        Implementation of the public ``send_commands`` interface.
+
+        This method will resolve the shell object once and then delegate all
+        the commands to it. If a subclass overrides :meth:`send_command`, each
+        command is sent through that override instead.
+
+        See :meth:`HighLevelShellAPI.send_commands` for more information.
+        """
+        if type(self).send_command is not CommonNode.send_command:
+            return super(CommonNode, self).send_commands(
+                cmds, shell=shell, silent=silent
+            )
+
+        active_shell = self._resolve_shell(shell)
+
+        responses = []
+        for cmd in cmds:
+            active_shell.send_command(cmd, silent=silent)
+            responses.append(active_shell.get_response(silent=silent))
+
+        return responses
+
+    def _resolve_shell(self, shell):
+        """
+        Get the shell object to send commands to.
+
+        :param str shell: Name of the shell. ``None`` for the default shell.
+        :rtype: BaseShell
+        :return: The shell object registered with that name.
+        """
         # Check at least one shell is available
         if not self._shells:
             raise Exception(
                 'Node {} doens\'t have any shell.'.format(self.identifier)
             )
 
-        # Check if default shell is already set
-        if self._default_shell is None:
-            self._default_shell = list(iterkeys(self._shells))[0]
-
-        # Check requested shell is supported
         if shell is None:
             shell = self._default_shell
-        elif shell not in self._shells.keys():
-            raise Exception(
-                'Shell {} is not supported.'.format(shell)
-            )
-
-        active_shell = self.get_shell(shell)
 
-        active_shell.send_command(cmd, silent=silent)
+            # Nodes that fill _shells directly, without _register_shell(),
+            # have no default yet: fall back to the first shell
+            if shell is None:
+                shell = self._default_shell = next(iter(self._shells))
 
-        response = active_shell.get_response(silent=silent)
+        # Check requested shell is supported, fetching it in the same lookup
+        active_shell = self._shells.get(shell, None)
+        if active_shell is None:
+            raise UnknownShellError(shell)
 
-        return response
+        return active_shell
 
     def _register_shell(self, name, shellobj):
         """
@@ -361,7 +428,8 @@ class CommonNode(BaseNode):
 
         This method will lookup for the shell name argument in an internal
         ordered dictionary and, if inexistent, it will register the given
-        shell object.
+        shell object. The first shell registered becomes the default shell,
+        unless one was already set.
 
         See :meth:`HighLevelShellAPI._register_shell` for more information.
         """
@@ -373,6 +441,8 @@ class CommonNode(BaseNode):
             raise KeyError('Invalid name for shell "{}"'.format(name))
 
         self._shells[name] = shellobj
+        if self._default_shell is None:
+            self._default_shell = name
 
         # Add the node identifier and the shell name to the shell object to
         # enable logging in the shell object itself
@@ -389,11 +459,12 @@ class CommonNode(BaseNode):
 
         See :meth:`LowLevelShellAPI.get_shell` for more information.
         """
-        if shell not in self._shells:
+        shellobj = self._shells.get(shell, None)
+        if shellobj is None:
             raise KeyError(
                 'Unknown shell "{}"'.format(shell)
             )
-        return self._shells[shell]
+        return shellobj
 
     def use_shell(self, shell):
         """
@@ -413,12 +484,12 @@ class CommonNode(BaseNode):
         """
         Implementation of the public ``available_services`` interface.
 
-        This method will just list the available keys in the internal ordered
-        dictionary.
+        This method will just list the available keys in the internal
+        dictionary, in registration order.
 
         See :meth:`ServicesAPI.available_services` for more information.
         """
-        return list(iterkeys(self._services))
+        return list(self._services)
 
     def get_service(self, service):
         """
@@ -429,13 +500,13 @@ class CommonNode(BaseNode):
 
         See :meth:`ServicesAPI.get_service` for more information.
         """
-        if service not in self._services:
+        serviceobj = self._services.get(service, None)
+        if serviceobj is None:
             raise KeyError(
                 'Unknown service "{}"'.format(service)
             )
 
         # Set the node address
-        serviceobj = self._services[service]
         serviceobj.address = self._get_services_address()
 
         return serviceobj
@@ -496,14 +567,16 @@ class CommonNode(BaseNode):
         """
         Command logging function for low-level shell API usage.
 
+        The command is logged at INFO level in this module logger, which
+        also records the time. No formatting is done if INFO is disabled.
+
         :param str command: Sent command to be logged.
         :param str shell: Name of the shell that sends the command.
         """
 
-        print(
-            '{} [{}].send_command(\'{}\', shell=\'{}\') ::'.format(
-                datetime.now().isoformat(), self.identifier, command, shell
-            )
+        log.info(
+            '[%s].send_command(\'%s\', shell=\'%s\') ::',
+            self.identifier, command, shell
         )
 
     def _log_response(self, response, shell):
@@ -513,7 +586,7 @@ class CommonNode(BaseNode):
         :param str response: Command response to be logged.
         :param str shell: Name of the shell that receives the command response.
         """
-        print(response.encode(self._shells[shell]._encoding))
+        log.info('%s', response)
 
     def _set_test_log(self, log):
         """
@@ -526,6 +599,7 @@ class CommonNode(BaseNode):
 
 
 __all__ = [
+    'UnknownShellError',
     'HighLevelShellAPI',
     'LowLevelShellAPI',
     'ServicesAPI',
@@ -27,9 +27,8 @@ from inspect import isclass
 from traceback import format_exc
 from collections import OrderedDict
 
-from pkg_resources import iter_entry_points
-
 from .node import BaseNode
+from ..entrypoints import entry_points
 
 
 log = logging.getLogger(__name__)
@@ -88,7 +87,7 @@ class NodeLoader(object):
         available = OrderedDict()
 
         # Iterate over entry points
-        for ep in iter_entry_points(group=self.entrypoint):
+        for ep in entry_points(group=self.entrypoint):
 
             name = ep.name
 
@@ -98,7 +97,8 @@ class NodeLoader(object):
                 log.exception(
                     'Unable to load node from plugin {}'.format(name)
                 )
-                log.debug(format_exc())
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(format_exc())
                 continue
 
             if not isclass(node) or not issubclass(node, self.base_class):
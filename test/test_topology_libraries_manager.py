@@ -37,3 +37,18 @@ def test_libraries():
 
     with pytest.raises(AssertionError):
         enode.libs.common.assert_batch('my command')
+
+
+def test_libraries_lazy_binding():
+    """
+    Test that libraries are bound to the enode once, on first access.
+    """
+    enode = DebugNode('myenode')
+
+    common = enode.libs.common
+    assert enode.libs.common is common
+    assert common.assert_batch.args == (enode,)
+
+    with pytest.raises(Exception) as excinfo:
+        enode.libs.nonexistent
+    assert 'nonexistent' in str(excinfo.value)
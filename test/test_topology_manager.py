@@ -28,7 +28,7 @@ import pytest  # noqa
 from deepdiff import DeepDiff
 
 # Reload module to properly measure coverage
-from six.moves import reload_module
+from importlib import reload as reload_module
 
 import topology.platforms.manager
 from topology.manager import TopologyManager
@@ -123,3 +123,95 @@ def test_autoport():
 
     ddiff = DeepDiff(ports, expected)
     assert not ddiff
+
+
+def test_load():
+    """
+    Test loading a topology from its dictionary description.
+    """
+    dictmeta = {
+        'nodes': [
+            {
+                'nodes': ['sw1'],
+                'attributes': {'type': 'switch'},
+                'parent': None
+            },
+            {
+                'nodes': ['hs1', 'hs2'],
+                'attributes': {'type': 'host'},
+                'parent': 'sw1'
+            },
+        ],
+        'ports': [
+            {
+                'ports': [('sw1', '1'), ('hs1', '1')],
+                'attributes': {'speed': 1000}
+            },
+        ],
+        'links': [
+            {
+                'endpoints': (('sw1', '1'), ('hs1', '1')),
+                'attributes': {'mtu': 1500}
+            },
+            {
+                'endpoints': (('sw1', '2'), ('hs3', '1')),
+                'attributes': {}
+            },
+        ]
+    }
+    inject = {
+        'environment': {},
+        'nodes': {'hs2': {'image': 'custom'}},
+        'ports': {('hs1', '1'): {'speed': 10}},
+        'links': {},
+    }
+
+    topology = TopologyManager(engine='debug')
+    topology.load(dictmeta, inject=inject)
+    graph = topology.graph
+    graph.check_consistency()
+
+    # Nodes and ports only referenced by a link are created too
+    assert {node.identifier for node in graph.nodes()} == {
+        'sw1', 'hs1', 'hs2', 'hs3'
+    }
+    assert graph.has_port_label('sw1', '2')
+    assert graph.has_port_label('hs3', '1')
+    assert graph.has_link('hs3', '1', 'sw1', '2')
+
+    # Attributes and injected attributes are set
+    assert graph.get_node('hs1').metadata == {'type': 'host'}
+    assert graph.get_node('hs2').metadata == {
+        'type': 'host', 'image': 'custom'
+    }
+    assert graph.get_port_by_label('sw1', '1').metadata['speed'] == 1000
+    assert graph.get_port_by_label('hs1', '1').metadata['speed'] == 10
+    assert graph.get_link('sw1', '1', 'hs1', '1').metadata == {'mtu': 1500}
+
+    # Parent-child relationships are set
+    sw1 = graph.get_node('sw1')
+    assert graph.get_node('hs1').parent is sw1
+    assert sw1.has_subnode('hs1') and sw1.has_subnode('hs2')
+
+
+def test_parse_cached():
+    """
+    Test that parsing the same description twice returns independent data.
+    """
+    topodesc = """
+        [type=host] hs1
+        hs1:1 -- hs2:1
+    """
+
+    topology1 = TopologyManager(engine='debug')
+    data1 = topology1.parse(topodesc, inject={
+        'environment': {'var': 'value'},
+        'nodes': {}, 'ports': {}, 'links': {}
+    })
+
+    topology2 = TopologyManager(engine='debug')
+    data2 = topology2.parse(topodesc)
+
+    assert data1 is not data2
+    assert 'var' not in data2['environment']
+    assert topology2.graph.get_node('hs1').metadata == {'type': 'host'}
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for module topology.platforms.manager.
+"""
+
+from pytest import raises
+
+from topology.platforms.debug import DebugPlatform
+from topology.platforms.manager import (
+    platforms, load_platform, DEFAULT_PLATFORM
+)
+
+
+def test_platforms():
+    """
+    Test that the default platform engine is discovered.
+    """
+    available = platforms()
+    assert DEFAULT_PLATFORM in available
+    assert available == tuple(sorted(available))
+    assert platforms() is available
+    assert platforms(cache=False) == available
+
+
+def test_load_platform():
+    """
+    Test loading platform engines by name.
+    """
+    assert load_platform(DEFAULT_PLATFORM) is DebugPlatform
+
+    with raises(RuntimeError):
+        load_platform('doesnotexist')
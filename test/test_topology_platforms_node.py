@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for module topology.platforms.node.
+"""
+
+from pytest import fixture, raises
+
+from topology.platforms.shell import BaseShell
+from topology.platforms.debug import DebugNode
+from topology.platforms.node import CommonNode, UnknownShellError
+
+
+class EchoShell(BaseShell):
+    """
+    Shell that answers every command with its name and the command.
+    """
+
+    def __init__(self, name):
+        super(EchoShell, self).__init__()
+        self.name = name
+        self.sent = []
+
+    def send_command(self, command, silent=False, **kwargs):
+        self.sent.append(command)
+
+    def get_response(self, connection=None, silent=False):
+        return '{}: {}'.format(self.name, self.sent[-1])
+
+    def is_connected(self, connection=None):
+        return True
+
+    def connect(self, *args, connection=None, **kwargs):
+        pass
+
+    def disconnect(self, *args, connection=None, **kwargs):
+        pass
+
+
+class Node(CommonNode):
+
+    def __init__(self, identifier, **kwargs):
+        super(Node, self).__init__(identifier, **kwargs)
+        self._register_shell('bash', EchoShell('bash'))
+        self._register_shell('vtysh', EchoShell('vtysh'))
+
+    def _get_services_address(self):
+        return '127.0.0.1'
+
+
+@fixture(scope='function')
+def node():
+    return Node('node')
+
+
+def test_send_command(node):
+    """
+    Test that commands are sent to the requested or the default shell.
+    """
+    assert node.available_shells() == ['bash', 'vtysh']
+
+    assert node('ls') == 'bash: ls'
+    assert node('show run', shell='vtysh') == 'vtysh: show run'
+
+    with raises(UnknownShellError) as excinfo:
+        node('ls', shell='python')
+    assert str(excinfo.value) == 'Shell python is not supported.'
+
+
+def test_send_commands(node):
+    """
+    Test sending a batch of commands to a node.
+    """
+    assert node.send_commands(['ls', 'pwd']) == ['bash: ls', 'bash: pwd']
+    assert node.send_commands(['show run'], shell='vtysh') == [
+        'vtysh: show run'
+    ]
+    assert node.get_shell('bash').sent == ['ls', 'pwd']
+
+    with raises(UnknownShellError):
+        node.send_commands(['ls'], shell='python')
+
+    enode = DebugNode('debug')
+    assert enode.send_commands(['ls', 'pwd']) == ['ls', 'pwd']
+
+
+def test_send_commands_override():
+    """
+    Test that a batch goes through an overridden ``send_command``.
+    """
+
+    class WrapperNode(Node):
+
+        def send_command(self, cmd, shell=None, silent=False):
+            response = super(WrapperNode, self).send_command(
+                cmd, shell=shell, silent=silent
+            )
+            return response.upper()
+
+    node = WrapperNode('wrapper')
+    assert node.send_commands(['ls', 'pwd']) == ['BASH: LS', 'BASH: PWD']
+
+
+def test_get_shell(node):
+    """
+    Test getting the shell objects registered in a node.
+    """
+    assert node.get_shell('vtysh').name == 'vtysh'
+
+    with raises(KeyError):
+        node.get_shell('python')
+
+
+def test_default_shell(node):
+    """
+    Test that the first registered shell is the default one.
+    """
+    assert node.default_shell == 'bash'
+
+    with node.use_shell('vtysh'):
+        assert node.default_shell == 'vtysh'
+        assert node('show run') == 'vtysh: show run'
+
+    assert node.default_shell == 'bash'
+
+
+def test_default_shell_unregistered():
+    """
+    Test the default shell of a node that fills its shells directly.
+    """
+    node = Node('node')
+    node._shells = {'vtysh': EchoShell('vtysh')}
+    node._default_shell = None
+
+    assert node('show run') == 'vtysh: show run'
+    assert node.default_shell == 'vtysh'
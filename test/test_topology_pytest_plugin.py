@@ -27,7 +27,7 @@ from __future__ import print_function, division
 from pytest import mark
 
 # Reload module to properly measure coverage
-from six.moves import reload_module
+from importlib import reload as reload_module
 
 import topology.pytest.plugin
 from topology.manager import TopologyManager